@@ -14,23 +14,28 @@
 from __future__ import annotations
 
 import asyncio
+import random
 import time
-from functools import singledispatch
+from functools import lru_cache
 from logging import Logger, getLogger
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Union
 
 import boto3
 
+try:  # orjson is an optional dependency; the stdlib encoder is used when absent
+    import orjson
+except ImportError:
+    orjson = None
+
 from braket.annealing.problem import Problem
 from braket.aws.aws_session import AwsSession
 from braket.circuits.circuit import Circuit
 from braket.circuits.circuit_helpers import validate_circuit_and_shots
-from braket.device_schema import GateModelParameters
-from braket.device_schema.dwave import DwaveDeviceParameters
-from braket.device_schema.ionq import IonqDeviceParameters
-from braket.device_schema.rigetti import RigettiDeviceParameters
-from braket.device_schema.simulators import GateModelSimulatorDeviceParameters
 from braket.schema_common import BraketSchemaBase
+
+# The device_schema parameter models are intentionally not imported at module level:
+# building their pydantic classes is a large part of `import braket.aws` time, and a
+# given create() call needs exactly one of them, so they are imported where used.
 from braket.task_result import AnnealingTaskResult, GateModelTaskResult
 from braket.tasks import AnnealingQuantumTaskResult, GateModelQuantumTaskResult, QuantumTask
 
@@ -42,9 +47,14 @@ class AwsQuantumTask(QuantumTask):
     # TODO: Add API documentation that defines these states. Make it clear this is the contract.
     NO_RESULT_TERMINAL_STATES = {"FAILED", "CANCELLED"}
     RESULTS_READY_STATES = {"COMPLETED"}
+    TERMINAL_STATES = NO_RESULT_TERMINAL_STATES | RESULTS_READY_STATES
+
+    METADATA_FRESHNESS_SECONDS = 0.5
 
     DEFAULT_RESULTS_POLL_TIMEOUT = 120
     DEFAULT_RESULTS_POLL_INTERVAL = 0.25
+    RESULTS_POLL_INTERVAL_MAX = 10
+    RESULTS_POLL_BACKOFF_FACTOR = 1.5
     RESULTS_FILENAME = "results.json"
 
     @staticmethod
@@ -116,12 +126,65 @@ class AwsQuantumTask(QuantumTask):
             **kwargs,
         )
 
+    @staticmethod
+    def results(
+        tasks: List[AwsQuantumTask],
+    ) -> List[Union[GateModelQuantumTaskResult, AnnealingQuantumTaskResult]]:
+        """
+        Get the results of multiple quantum tasks, waiting for all of them to complete.
+
+        This method is a blocking thread call that drives all the tasks concurrently on a
+        single event loop; use it instead of calling `result()` on each task in turn,
+        which waits for the tasks one at a time.
+
+        Args:
+            tasks (List[AwsQuantumTask]): The tasks to get the results of.
+
+        Returns:
+            List[Union[GateModelQuantumTaskResult, AnnealingQuantumTaskResult]]: The results
+            of the given tasks, in the same order the tasks were given. An entry is `None`
+            if the task timed out or is in a state in
+            `AwsQuantumTask.NO_RESULT_TERMINAL_STATES`.
+        """
+        try:
+            loop = asyncio.get_event_loop()
+        except Exception:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+        return loop.run_until_complete(AwsQuantumTask.results_async(tasks))
+
+    @staticmethod
+    async def results_async(
+        tasks: List[AwsQuantumTask],
+    ) -> List[Union[GateModelQuantumTaskResult, AnnealingQuantumTaskResult]]:
+        """
+        Get the results of multiple quantum tasks asynchronously.
+
+        All the tasks share one `asyncio.wait` loop rather than being awaited one by one,
+        so each task stops issuing `GetQuantumTask` calls the moment it completes.
+
+        Args:
+            tasks (List[AwsQuantumTask]): The tasks to get the results of.
+
+        Returns:
+            List[Union[GateModelQuantumTaskResult, AnnealingQuantumTaskResult]]: The results
+            of the given tasks, in the same order the tasks were given. An entry is `None`
+            if the task timed out or is in a state in
+            `AwsQuantumTask.NO_RESULT_TERMINAL_STATES`.
+        """
+        futures = [asyncio.create_task(task._wait_for_completion()) for task in tasks]
+        pending = set(futures)
+        while pending:
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        return [future.result() for future in futures]
+
     def __init__(
         self,
         arn: str,
         aws_session: AwsSession = None,
         poll_timeout_seconds: int = DEFAULT_RESULTS_POLL_TIMEOUT,
         poll_interval_seconds: int = DEFAULT_RESULTS_POLL_INTERVAL,
+        notification_queue_url: str = None,
         logger: Logger = getLogger(__name__),
     ):
         """
@@ -131,8 +194,16 @@ class AwsQuantumTask(QuantumTask):
                 Default is `None`, in which case an `AwsSession` object will be created with the
                 region of the task.
             poll_timeout_seconds (int): The polling timeout for result(), default is 120 seconds.
-            poll_interval_seconds (int): The polling interval for result(), default is 0.25
-                seconds.
+            poll_interval_seconds (int): The initial polling interval for result(), default is
+                0.25 seconds. While the task status does not change, the interval backs off
+                exponentially (multiplied by `RESULTS_POLL_BACKOFF_FACTOR` after each poll,
+                capped at `RESULTS_POLL_INTERVAL_MAX` seconds); on a status transition the
+                interval resets to this value.
+            notification_queue_url (str, optional): The URL of an SQS queue that S3
+                `ObjectCreated` event notifications for the task's results bucket are
+                delivered to. If given, result() waits for the results object to appear
+                in S3 instead of repeatedly polling the Amazon Braket `GetQuantumTask`
+                operation. Default is `None`, in which case polling is used.
             logger (Logger): Logger object with which to write logs, such as task statuses
                 while waiting for task to be in a terminal state. Default is `getLogger(__name__)`
 
@@ -154,10 +225,14 @@ class AwsQuantumTask(QuantumTask):
         )
         self._poll_timeout_seconds = poll_timeout_seconds
         self._poll_interval_seconds = poll_interval_seconds
+        self._notification_queue_url = notification_queue_url
         self._logger = logger
 
         self._metadata: Dict[str, Any] = {}
+        self._metadata_fetched_at: float = None
         self._result: Union[GateModelQuantumTaskResult, AnnealingQuantumTaskResult] = None
+        self._loop: asyncio.AbstractEventLoop = None
+        self._future: asyncio.Future = None
 
     @staticmethod
     def _aws_session_for_task_arn(task_arn: str) -> AwsSession:
@@ -165,11 +240,13 @@ class AwsQuantumTask(QuantumTask):
         Get an AwsSession for the Task ARN. The AWS session should be in the region of the task.
 
         Returns:
-            AwsSession: `AwsSession` object with default `boto_session` in task's region
+            AwsSession: `AwsSession` object with default `boto_session` in task's region.
+            Sessions are shared between tasks in the same region, since constructing a
+            `boto3.Session` resolves credentials and endpoints anew each time.
         """
-        task_region = task_arn.split(":")[3]
-        boto_session = boto3.Session(region_name=task_region)
-        return AwsSession(boto_session=boto_session)
+        # maxsplit=4 stops after the region field instead of splitting the whole ARN
+        task_region = task_arn.split(":", 4)[3]
+        return _aws_session_for_region(task_region)
 
     @property
     def id(self) -> str:
@@ -178,11 +255,9 @@ class AwsQuantumTask(QuantumTask):
 
     def _cancel_future(self) -> None:
         """Cancel the future if it exists. Else, create a cancelled future."""
-        if hasattr(self, "_future"):
-            self._future.cancel()
-        else:
+        if self._future is None:
             self._future = asyncio.Future()
-            self._future.cancel()
+        self._future.cancel()
 
     def cancel(self) -> None:
         """Cancel the quantum task. This cancels the future and the task in Amazon Braket."""
@@ -202,9 +277,31 @@ class AwsQuantumTask(QuantumTask):
             Dict[str, Any]: The response from the Amazon Braket `GetQuantumTask` operation.
             If `use_cached_value` is `True`, Amazon Braket is not called and the most recently
             retrieved value is used.
+
+        Note:
+            Once the task has been observed in a terminal state, metadata retrieved within
+            `METADATA_FRESHNESS_SECONDS` of that observation is also served from the cache,
+            since terminal metadata no longer changes; this avoids a redundant
+            `GetQuantumTask` call in the common `result()`-then-`metadata()` pattern.
         """
-        if not use_cached_value:
-            self._metadata = self._aws_session.get_quantum_task(self._arn)
+        if use_cached_value or self._is_metadata_fresh():
+            return self._metadata
+        return self._update_metadata()
+
+    def _is_metadata_fresh(self) -> bool:
+        return (
+            self._metadata_fetched_at is not None
+            and (time.monotonic() - self._metadata_fetched_at)
+            < AwsQuantumTask.METADATA_FRESHNESS_SECONDS
+        )
+
+    def _update_metadata(self) -> Dict[str, Any]:
+        """Call `GetQuantumTask` unconditionally and update the metadata cache. The
+        freshness timestamp is only set once the task is terminal, so polling callers
+        never see stale in-progress metadata."""
+        self._metadata = self._aws_session.get_quantum_task(self._arn)
+        if self._metadata.get("status") in AwsQuantumTask.TERMINAL_STATES:
+            self._metadata_fetched_at = time.monotonic()
         return self._metadata
 
     def state(self, use_cached_value: bool = False) -> str:
@@ -234,25 +331,52 @@ class AwsQuantumTask(QuantumTask):
         This method is a blocking thread call and synchronously returns a result. Call
         async_result() if you require an asynchronous invocation.
         Consecutive calls to this method return a cached result from the preceding request.
+
+        Tasks that are already in a terminal state — the common case when reconstructing
+        an `AwsQuantumTask` from the ARN of a finished task — are resolved with a single
+        synchronous `GetQuantumTask` call, without starting the event-loop polling
+        machinery.
         """
+        if self._result is not None:
+            return self._result
+
+        current_metadata = self.metadata()
+        task_status = current_metadata["status"]
+        if task_status in AwsQuantumTask.RESULTS_READY_STATES:
+            return self._download_result(current_metadata)
+        elif task_status in AwsQuantumTask.NO_RESULT_TERMINAL_STATES:
+            self._logger.warning(
+                f"Task is in terminal state {task_status} and no result is available"
+            )
+            return None
+
         try:
             async_result = self.async_result()
-            return asyncio.get_event_loop().run_until_complete(async_result)
+            return self._ensure_loop().run_until_complete(async_result)
         except asyncio.CancelledError:
             # Future was cancelled, return whatever is in self._result if anything
             self._logger.warning("Task future was cancelled")
             return self._result
 
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the event loop used to drive this task's futures. The loop is looked up (or
+        created, in threads that do not have one) only once and cached on the instance.
+        """
+        if self._loop is None:
+            try:
+                self._loop = asyncio.get_event_loop()
+            except Exception as e:
+                self._logger.debug(e)
+                self._logger.info("No event loop found; creating new event loop")
+                self._loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(self._loop)
+        return self._loop
+
     def _get_future(self):
-        try:
-            asyncio.get_event_loop()
-        except Exception as e:
-            self._logger.debug(e)
-            self._logger.info("No event loop found; creating new event loop")
-            asyncio.set_event_loop(asyncio.new_event_loop())
-
-        if not hasattr(self, "_future"):
-            self._future = asyncio.get_event_loop().run_until_complete(self._create_future())
+        loop = self._ensure_loop()
+        if self._future is None:
+            self._future = loop.run_until_complete(self._create_future())
         elif (
             self._future.done() and not self._future.cancelled() and self._result is None
         ):  # timed out and no result
@@ -262,7 +386,7 @@ class AwsQuantumTask(QuantumTask):
                     f"Task is in terminal state {task_status} and no result is available"
                 )
             else:
-                self._future = asyncio.get_event_loop().run_until_complete(self._create_future())
+                self._future = loop.run_until_complete(self._create_future())
         return self._future
 
     def async_result(self) -> asyncio.Task:
@@ -296,23 +420,25 @@ class AwsQuantumTask(QuantumTask):
                 `None` is returned if a timeout occurs or task state is in
                 `AwsQuantumTask.NO_RESULT_TERMINAL_STATES`.
         Note:
-            Timeout and sleep intervals are defined in the constructor fields
-                `poll_timeout_seconds` and `poll_interval_seconds` respectively.
+            Timeout and initial sleep interval are defined in the constructor fields
+                `poll_timeout_seconds` and `poll_interval_seconds` respectively; the sleep
+                interval backs off exponentially with jitter, capped at
+                `RESULTS_POLL_INTERVAL_MAX`, while the task status does not change.
         """
-        self._logger.debug(f"Task {self._arn}: start polling for completion")
+        if self._notification_queue_url:
+            return await self._wait_for_notification()
+
+        self._logger.debug("Task %s: start polling for completion", self._arn)
         start_time = time.time()
+        poll_interval = self._poll_interval_seconds
+        last_task_status = None
 
         while (time.time() - start_time) < self._poll_timeout_seconds:
-            current_metadata = self.metadata()
+            current_metadata = self._update_metadata()
             task_status = current_metadata["status"]
-            self._logger.debug(f"Task {self._arn}: task status {task_status}")
+            self._logger.debug("Task %s: task status %s", self._arn, task_status)
             if task_status in AwsQuantumTask.RESULTS_READY_STATES:
-                result_string = self._aws_session.retrieve_s3_object_body(
-                    current_metadata["outputS3Bucket"],
-                    current_metadata["outputS3Directory"] + f"/{AwsQuantumTask.RESULTS_FILENAME}",
-                )
-                self._result = _format_result(BraketSchemaBase.parse_raw_schema(result_string))
-                return self._result
+                return self._download_result(current_metadata)
             elif task_status in AwsQuantumTask.NO_RESULT_TERMINAL_STATES:
                 self._logger.warning(
                     f"Task is in terminal state {task_status} and no result is available"
@@ -320,7 +446,16 @@ class AwsQuantumTask(QuantumTask):
                 self._result = None
                 return None
             else:
-                await asyncio.sleep(self._poll_interval_seconds)
+                if task_status != last_task_status:
+                    # Status transition: poll densely again, the task may be close to finishing
+                    poll_interval = self._poll_interval_seconds
+                last_task_status = task_status
+                # Jitter desynchronizes polls from tasks submitted at the same time
+                await asyncio.sleep(random.uniform(0.9 * poll_interval, poll_interval))
+                poll_interval = min(
+                    poll_interval * AwsQuantumTask.RESULTS_POLL_BACKOFF_FACTOR,
+                    AwsQuantumTask.RESULTS_POLL_INTERVAL_MAX,
+                )
 
         # Timed out
         self._logger.warning(
@@ -332,6 +467,93 @@ class AwsQuantumTask(QuantumTask):
         self._result = None
         return None
 
+    async def _wait_for_notification(
+        self,
+    ) -> Union[GateModelQuantumTaskResult, AnnealingQuantumTaskResult]:
+        """
+        Waits for the task's results object to appear in the S3 bucket, then returns the result.
+
+        S3 `ObjectCreated` event notifications are read from the SQS queue given by
+        `notification_queue_url`; a single `GetQuantumTask` call is made up front to locate
+        the results object and to short-circuit tasks that are already in a terminal state.
+
+        Returns:
+            Union[GateModelQuantumTaskResult, AnnealingQuantumTaskResult]: The result from
+                the S3 bucket, or `None` if no notification for the results object arrives
+                within `poll_timeout_seconds`. Note that tasks that end up in
+                `AwsQuantumTask.NO_RESULT_TERMINAL_STATES` never write results to S3, so
+                they are only detected by the up-front status check.
+        """
+        current_metadata = self._update_metadata()
+        task_status = current_metadata["status"]
+        if task_status in AwsQuantumTask.RESULTS_READY_STATES:
+            return self._download_result(current_metadata)
+        elif task_status in AwsQuantumTask.NO_RESULT_TERMINAL_STATES:
+            self._logger.warning(
+                f"Task is in terminal state {task_status} and no result is available"
+            )
+            self._result = None
+            return None
+
+        results_key = current_metadata["outputS3Directory"] + f"/{AwsQuantumTask.RESULTS_FILENAME}"
+        self._completion_event = asyncio.Event()
+        listener = asyncio.create_task(self._listen_for_result_notification(results_key))
+        try:
+            await asyncio.wait_for(
+                self._completion_event.wait(), timeout=self._poll_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            self._logger.warning(
+                f"Task {self._arn}: no notification for {results_key} received within "
+                + f"{self._poll_timeout_seconds} seconds. Please increase the timeout; "
+                + "this can be done by creating a new AwsQuantumTask with this task's ARN "
+                + "and a higher value for the `poll_timeout_seconds` parameter."
+            )
+            self._result = None
+            return None
+        finally:
+            listener.cancel()
+        return self._download_result(self.metadata())
+
+    async def _listen_for_result_notification(self, results_key: str) -> None:
+        """
+        Long-polls the notification queue until a notification for `results_key` arrives,
+        then sets `_completion_event`. SQS long polling blocks, so it runs in an executor
+        to keep the event loop free for other tasks.
+        """
+        loop = asyncio.get_event_loop()
+        while True:
+            try:
+                object_keys = await loop.run_in_executor(
+                    None,
+                    self._aws_session.receive_s3_notifications,
+                    self._notification_queue_url,
+                    [results_key],
+                )
+            except Exception as e:
+                self._logger.warning(
+                    f"Task {self._arn}: receiving notifications from "
+                    + f"{self._notification_queue_url} failed with {e}; "
+                    + "waiting for the results object will time out"
+                )
+                raise
+            if results_key in object_keys:
+                self._completion_event.set()
+                return
+
+    def _download_result(
+        self, current_metadata: Dict[str, Any]
+    ) -> Union[GateModelQuantumTaskResult, AnnealingQuantumTaskResult]:
+        """Retrieve the results object from the S3 bucket in `current_metadata` and parse it."""
+        result_stream = self._aws_session.retrieve_s3_object_stream(
+            current_metadata["outputS3Bucket"],
+            current_metadata["outputS3Directory"] + f"/{AwsQuantumTask.RESULTS_FILENAME}",
+        )
+        # parse_raw_schema accepts bytes, so the payload is parsed without an
+        # intermediate decoded string copy
+        self._result = _format_result(BraketSchemaBase.parse_raw_schema(result_stream.read()))
+        return self._result
+
     def __repr__(self) -> str:
         return f"AwsQuantumTask('id':{self.id})"
 
@@ -344,7 +566,11 @@ class AwsQuantumTask(QuantumTask):
         return hash(self.id)
 
 
-@singledispatch
+@lru_cache(maxsize=16)
+def _aws_session_for_region(region: str) -> AwsSession:
+    return AwsSession(boto_session=boto3.Session(region_name=region))
+
+
 def _create_internal(
     task_specification: Union[Circuit, Problem],
     aws_session: AwsSession,
@@ -354,11 +580,23 @@ def _create_internal(
     *args,
     **kwargs,
 ) -> AwsQuantumTask:
+    # Exact-type dict lookup first; the MRO walk only runs for subclasses
+    for klass in type(task_specification).__mro__:
+        create = _CREATE_DISPATCH.get(klass)
+        if create is not None:
+            return create(
+                task_specification,
+                aws_session,
+                create_task_kwargs,
+                device_parameters,
+                device_arn,
+                *args,
+                **kwargs,
+            )
     raise TypeError("Invalid task specification type")
 
 
-@_create_internal.register
-def _(
+def _create_circuit_task(
     circuit: Circuit,
     aws_session: AwsSession,
     create_task_kwargs: Dict[str, Any],
@@ -371,36 +609,60 @@ def _(
 
     # TODO: Update this to use `deviceCapabilities` from Amazon Braket's GetDevice operation
     # in order to decide what parameters to build.
-    paradigm_parameters = GateModelParameters(qubitCount=circuit.qubit_count)
     if "ionq" in device_arn:
-        device_parameters = IonqDeviceParameters(paradigmParameters=paradigm_parameters)
+        device_family = "ionq"
     elif "rigetti" in device_arn:
-        device_parameters = RigettiDeviceParameters(paradigmParameters=paradigm_parameters)
+        device_family = "rigetti"
     else:  # default to use simulator
-        device_parameters = GateModelSimulatorDeviceParameters(
-            paradigmParameters=paradigm_parameters
-        )
+        device_family = "simulator"
 
     create_task_kwargs.update(
-        {"action": circuit.to_ir().json(), "deviceParameters": device_parameters.json()}
+        {
+            "action": _serialize_ir(circuit.to_ir()),
+            "deviceParameters": _device_parameters_json(device_family, circuit.qubit_count),
+        }
     )
     task_arn = aws_session.create_quantum_task(**create_task_kwargs)
     return AwsQuantumTask(task_arn, aws_session, *args, **kwargs)
 
 
-@_create_internal.register
-def _(
+@lru_cache(maxsize=64)
+def _device_parameters_json(device_family: str, qubit_count: int) -> str:
+    """
+    Serialized deviceParameters for a circuit task. The JSON depends only on the device
+    family and the qubit count, so it is cached; in batch submissions of uniform circuits
+    the pydantic serialization runs once instead of once per task.
+    """
+    from braket.device_schema import GateModelParameters
+
+    paradigm_parameters = GateModelParameters(qubitCount=qubit_count)
+    if device_family == "ionq":
+        from braket.device_schema.ionq import IonqDeviceParameters
+
+        return IonqDeviceParameters(paradigmParameters=paradigm_parameters).json()
+    if device_family == "rigetti":
+        from braket.device_schema.rigetti import RigettiDeviceParameters
+
+        return RigettiDeviceParameters(paradigmParameters=paradigm_parameters).json()
+    from braket.device_schema.simulators import GateModelSimulatorDeviceParameters
+
+    return GateModelSimulatorDeviceParameters(paradigmParameters=paradigm_parameters).json()
+
+
+def _create_problem_task(
     problem: Problem,
     aws_session: AwsSession,
     create_task_kwargs: Dict[str, Any],
-    device_parameters: Union[dict, DwaveDeviceParameters],
+    device_parameters: Union[dict, BraketSchemaBase],
     device_arn: str,
     *args,
     **kwargs,
 ) -> AwsQuantumTask:
+    from braket.device_schema.dwave import DwaveDeviceParameters
+
     create_task_kwargs.update(
         {
-            "action": problem.to_ir().json(),
+            "action": _serialize_ir(problem.to_ir()),
             "deviceParameters": DwaveDeviceParameters.parse_obj(device_parameters).json(),
         }
     )
@@ -409,6 +671,28 @@ def _(
     return AwsQuantumTask(task_arn, aws_session, *args, **kwargs)
 
 
+_CREATE_DISPATCH = {
+    Circuit: _create_circuit_task,
+    Problem: _create_problem_task,
+}
+
+
+def _serialize_ir(ir: BraketSchemaBase) -> str:
+    """
+    Serialize an IR schema object to a JSON string for the CreateQuantumTask action.
+
+    When the optional orjson dependency is installed, the IR dict is encoded with
+    orjson, which is several times faster than the stdlib encoder pydantic uses and
+    dominates client-side create() time for gate-heavy programs. Otherwise this
+    falls back to pydantic's own `.json()`.
+    """
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches pydantic's coercion of int dict keys (e.g. annealing
+        # problem variables) to JSON strings
+        return orjson.dumps(ir.dict(), option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return ir.json()
+
+
 def _create_common_params(
     device_arn: str, s3_destination_folder: AwsSession.S3DestinationFolder, shots: int
 ) -> Dict[str, Any]:
@@ -420,17 +704,27 @@ def _create_common_params(
     }
 
 
-@singledispatch
-def _format_result(result):
+def _format_result(
+    result: Union[GateModelTaskResult, AnnealingTaskResult]
+) -> Union[GateModelQuantumTaskResult, AnnealingQuantumTaskResult]:
+    # Exact-type dict lookup first; the MRO walk only runs for subclasses
+    for klass in type(result).__mro__:
+        format_result = _FORMAT_DISPATCH.get(klass)
+        if format_result is not None:
+            return format_result(result)
     raise TypeError("Invalid result specification type")
 
 
-@_format_result.register
-def _(result: GateModelTaskResult) -> GateModelQuantumTaskResult:
+def _format_gate_model_result(result: GateModelTaskResult) -> GateModelQuantumTaskResult:
     GateModelQuantumTaskResult.cast_result_types(result)
     return GateModelQuantumTaskResult.from_object(result)
 
 
-@_format_result.register
-def _(result: AnnealingTaskResult) -> AnnealingQuantumTaskResult:
+def _format_annealing_result(result: AnnealingTaskResult) -> AnnealingQuantumTaskResult:
     return AnnealingQuantumTaskResult.from_object(result)
+
+
+_FORMAT_DISPATCH = {
+    GateModelTaskResult: _format_gate_model_result,
+    AnnealingTaskResult: _format_annealing_result,
+}
@@ -11,7 +11,9 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import json
 from typing import Any, Dict, List, NamedTuple, Optional
+from urllib.parse import unquote_plus
 
 import backoff
 import boto3
@@ -103,9 +105,76 @@ class AwsSession(object):
         Returns:
             str: The body of the S3 object
         """
+        return self.retrieve_s3_object_stream(s3_bucket, s3_object_key).read().decode("utf-8")
+
+    def retrieve_s3_object_stream(self, s3_bucket: str, s3_object_key: str):
+        """
+        Retrieve the S3 object body as a stream, without buffering it into a string.
+        Prefer this over `retrieve_s3_object_body` for large objects whose bytes are
+        handed straight to a parser; it avoids an extra decode/copy of the payload.
+
+        Args:
+            s3_bucket (str): The S3 bucket name
+            s3_object_key (str): The S3 object key within the `s3_bucket`
+
+        Returns:
+            botocore.response.StreamingBody: The streaming body of the S3 object
+        """
         s3 = self.boto_session.resource("s3")
         obj = s3.Object(s3_bucket, s3_object_key)
-        return obj.get()["Body"].read().decode("utf-8")
+        return obj.get()["Body"]
+
+    def receive_s3_notifications(
+        self, queue_url: str, object_keys: List[str], wait_time_seconds: int = 20
+    ) -> List[str]:
+        """
+        Receive S3 `ObjectCreated` notifications from an SQS queue.
+
+        Long-polls the queue for up to `wait_time_seconds` and returns the keys from
+        `object_keys` whose objects have been created. Both raw S3 event notifications
+        and SNS-enveloped notifications are supported. Only messages for the requested
+        keys (and messages carrying no `ObjectCreated` records at all, such as the
+        `s3:TestEvent` sent on notification setup) are deleted; notifications for other
+        objects are left on the queue to reappear after the SQS visibility timeout, so
+        the queue can be shared by consumers waiting on different objects in the bucket.
+
+        Args:
+            queue_url (str): The URL of the SQS queue that S3 event notifications
+                are delivered to.
+            object_keys (List[str]): The S3 object keys to watch for.
+            wait_time_seconds (int): The SQS long-poll wait time, default is 20 seconds.
+
+        Returns:
+            List[str]: The keys from `object_keys` whose notifications arrived, if any.
+        """
+        sqs = self.boto_session.client("sqs")
+        response = sqs.receive_message(
+            QueueUrl=queue_url, MaxNumberOfMessages=10, WaitTimeSeconds=wait_time_seconds
+        )
+        matched_keys = []
+        consumed = []
+        for message in response.get("Messages", []):
+            body = json.loads(message["Body"])
+            if "Message" in body:  # SNS envelope
+                body = json.loads(body["Message"])
+            message_keys = [
+                # S3 URL-encodes object keys in event notifications
+                unquote_plus(record["s3"]["object"]["key"])
+                for record in body.get("Records", [])
+                if record.get("eventName", "").startswith("ObjectCreated")
+            ]
+            matched = [key for key in message_keys if key in object_keys]
+            matched_keys.extend(matched)
+            # Only delete a message once every record in it was asked for here; a
+            # message batching records for several consumers stays visible so the
+            # others still receive their notifications
+            if len(matched) == len(message_keys):
+                consumed.append(
+                    {"Id": message["MessageId"], "ReceiptHandle": message["ReceiptHandle"]}
+                )
+        if consumed:
+            sqs.delete_message_batch(QueueUrl=queue_url, Entries=consumed)
+        return matched_keys
 
     def get_device(self, arn: str) -> Dict[str, Any]:
         """
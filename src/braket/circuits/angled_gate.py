@@ -21,10 +21,13 @@ class AngledGate(Gate):
     Class `AngledGate` represents a quantum gate that operates on N qubits and an angle.
     """
 
+    __slots__ = ("_angle",)
+
     def __init__(self, angle: float, qubit_count: int, ascii_symbols: Sequence[str]):
         """
         Args:
-            angle (float): The angle of the gate in radians.
+            angle (float): The angle of the gate in radians. Any real number is
+                accepted and stored as a `float`.
             qubit_count (int): The number of qubits that this gate interacts with.
             ascii_symbols (Sequence[str]): ASCII string symbols for the gate. These are used when
                 printing a diagram of a circuit. The length must be the same as `qubit_count`, and
@@ -40,7 +43,9 @@ class AngledGate(Gate):
         super().__init__(qubit_count=qubit_count, ascii_symbols=ascii_symbols)
         if angle is None:
             raise ValueError("angle must not be None")
-        self._angle = angle
+        # Accept any real number (int, numpy scalar, ...) and store a plain float,
+        # so per-instance storage and later IR serialization see a uniform type
+        self._angle = float(angle)
 
     @property
     def angle(self) -> float:
@@ -24,6 +24,8 @@ class Gate(QuantumOperator):
     the metadata that defines what a gate is and what it does.
     """
 
+    __slots__ = ()
+
     def __init__(self, qubit_count: int, ascii_symbols: Sequence[str]):
         """
         Args:
@@ -42,6 +42,8 @@ To add a new gate:
 class H(Gate):
     """Hadamard gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(qubit_count=1, ascii_symbols=["H"])
 
@@ -75,6 +77,8 @@ Gate.register_gate(H)
 class I(Gate):  # noqa: E742, E261
     """Identity gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(qubit_count=1, ascii_symbols=["I"])
 
@@ -108,6 +112,8 @@ Gate.register_gate(I)
 class X(Gate):
     """Pauli-X gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(qubit_count=1, ascii_symbols=["X"])
 
@@ -141,6 +147,8 @@ Gate.register_gate(X)
 class Y(Gate):
     """Pauli-Y gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(qubit_count=1, ascii_symbols=["Y"])
 
@@ -174,6 +182,8 @@ Gate.register_gate(Y)
 class Z(Gate):
     """Pauli-Z gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(qubit_count=1, ascii_symbols=["Z"])
 
@@ -207,6 +217,8 @@ Gate.register_gate(Z)
 class S(Gate):
     """S gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(qubit_count=1, ascii_symbols=["S"])
 
@@ -241,6 +253,8 @@ Gate.register_gate(S)
 class Si(Gate):
     """Conjugate transpose of S gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(qubit_count=1, ascii_symbols=["Si"])
 
@@ -274,6 +288,8 @@ Gate.register_gate(Si)
 class T(Gate):
     """T gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(qubit_count=1, ascii_symbols=["T"])
 
@@ -307,6 +323,8 @@ Gate.register_gate(T)
 class Ti(Gate):
     """Conjugate transpose of T gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(qubit_count=1, ascii_symbols=["Ti"])
 
@@ -340,6 +358,8 @@ Gate.register_gate(Ti)
 class V(Gate):
     """Square root of not gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(qubit_count=1, ascii_symbols=["V"])
 
@@ -373,6 +393,8 @@ Gate.register_gate(V)
 class Vi(Gate):
     """Conjugate transpose of square root of not gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(qubit_count=1, ascii_symbols=["Vi"])
 
@@ -413,6 +435,8 @@ class Rx(AngledGate):
         angle (float): angle in radians.
     """
 
+    __slots__ = ()
+
     def __init__(self, angle: float):
         super().__init__(angle=angle, qubit_count=1, ascii_symbols=["Rx({:.3g})".format(angle)])
 
@@ -452,6 +476,8 @@ class Ry(AngledGate):
         angle (float): angle in radians.
     """
 
+    __slots__ = ()
+
     def __init__(self, angle: float):
         super().__init__(angle=angle, qubit_count=1, ascii_symbols=["Ry({:.3g})".format(angle)])
 
@@ -491,6 +517,8 @@ class Rz(AngledGate):
         angle (float): angle in radians.
     """
 
+    __slots__ = ()
+
     def __init__(self, angle: float):
         super().__init__(angle=angle, qubit_count=1, ascii_symbols=["Rz({:.3g})".format(angle)])
 
@@ -530,6 +558,8 @@ class PhaseShift(AngledGate):
         angle (float): angle in radians.
     """
 
+    __slots__ = ()
+
     def __init__(self, angle: float):
         super().__init__(angle=angle, qubit_count=1, ascii_symbols=["PHASE({:.3g})".format(angle)])
 
@@ -566,6 +596,8 @@ Gate.register_gate(PhaseShift)
 class CNot(Gate):
     """Controlled NOT gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(qubit_count=2, ascii_symbols=["C", "X"])
 
@@ -607,6 +639,8 @@ Gate.register_gate(CNot)
 class Swap(Gate):
     """Swap gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(qubit_count=2, ascii_symbols=["SWAP", "SWAP"])
 
@@ -648,6 +682,8 @@ Gate.register_gate(Swap)
 class ISwap(Gate):
     """ISwap gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(qubit_count=2, ascii_symbols=["ISWAP", "ISWAP"])
 
@@ -693,6 +729,8 @@ class PSwap(AngledGate):
         angle (float): angle in radians.
     """
 
+    __slots__ = ()
+
     def __init__(self, angle: float):
         super().__init__(
             angle=angle,
@@ -744,6 +782,8 @@ class XY(AngledGate):
         angle (float): angle in radians.
     """
 
+    __slots__ = ()
+
     def __init__(self, angle: float):
         super().__init__(
             angle=angle,
@@ -795,6 +835,8 @@ class CPhaseShift(AngledGate):
         angle (float): angle in radians.
     """
 
+    __slots__ = ()
+
     def __init__(self, angle: float):
         super().__init__(
             angle=angle, qubit_count=2, ascii_symbols=["C", "PHASE({:.3g})".format(angle)]
@@ -835,6 +877,8 @@ class CPhaseShift00(AngledGate):
         angle (float): angle in radians.
     """
 
+    __slots__ = ()
+
     def __init__(self, angle: float):
         super().__init__(
             angle=angle, qubit_count=2, ascii_symbols=["C", "PHASE00({:.3g})".format(angle)]
@@ -875,6 +919,8 @@ class CPhaseShift01(AngledGate):
         angle (float): angle in radians.
     """
 
+    __slots__ = ()
+
     def __init__(self, angle: float):
         super().__init__(
             angle=angle, qubit_count=2, ascii_symbols=["C", "PHASE01({:.3g})".format(angle)]
@@ -915,6 +961,8 @@ class CPhaseShift10(AngledGate):
         angle (float): angle in radians.
     """
 
+    __slots__ = ()
+
     def __init__(self, angle: float):
         super().__init__(
             angle=angle, qubit_count=2, ascii_symbols=["C", "PHASE10({:.3g})".format(angle)]
@@ -951,6 +999,8 @@ Gate.register_gate(CPhaseShift10)
 class CY(Gate):
     """Controlled Pauli-Y gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(qubit_count=2, ascii_symbols=["C", "Y"])
 
@@ -992,6 +1042,8 @@ Gate.register_gate(CY)
 class CZ(Gate):
     """Controlled Pauli-Z gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(qubit_count=2, ascii_symbols=["C", "Z"])
 
@@ -1031,6 +1083,8 @@ class XX(AngledGate):
         angle (float): angle in radians.
     """
 
+    __slots__ = ()
+
     def __init__(self, angle: float):
         super().__init__(
             angle=angle,
@@ -1085,6 +1139,8 @@ class YY(AngledGate):
         angle (float): angle in radians.
     """
 
+    __slots__ = ()
+
     def __init__(self, angle: float):
         super().__init__(
             angle=angle,
@@ -1139,6 +1195,8 @@ class ZZ(AngledGate):
         angle (float): angle in radians.
     """
 
+    __slots__ = ()
+
     def __init__(self, angle: float):
         super().__init__(
             angle=angle,
@@ -1188,6 +1246,8 @@ Gate.register_gate(ZZ)
 class CCNot(Gate):
     """CCNOT gate or Toffoli gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(qubit_count=3, ascii_symbols=["C", "C", "X"])
 
@@ -1234,6 +1294,8 @@ Gate.register_gate(CCNot)
 class CSwap(Gate):
     """Controlled Swap gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(qubit_count=3, ascii_symbols=["C", "SWAP", "SWAP"])
 
@@ -1291,6 +1353,8 @@ class Unitary(Gate):
             or is non-unitary.
     """
 
+    __slots__ = ("_matrix",)
+
     def __init__(self, matrix: np.ndarray, display_name: str = "U"):
         verify_quantum_operator_matrix_dimensions(matrix)
         self._matrix = np.array(matrix, dtype=complex)
@@ -17,6 +17,8 @@ from abc import ABC, abstractmethod
 class Operator(ABC):
     """An operator is the abstract definition of an operation for a quantum device."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -12,7 +12,7 @@
 # language governing permissions and limitations under the License.
 from __future__ import annotations
 
-from typing import Any, List, Sequence
+from typing import Any, Sequence, Tuple
 
 import numpy as np
 
@@ -20,7 +20,26 @@ from braket.circuits.operator import Operator
 
 
 class QuantumOperator(Operator):
-    """A quantum operator is the definition of a quantum operation for a quantum device."""
+    """A quantum operator is the definition of a quantum operation for a quantum device.
+
+    Note:
+        `QuantumOperator` and its subclasses in this package declare `__slots__`, since
+        circuits instantiate one operator per instruction and the per-instance `__dict__`
+        would dominate memory on large circuits. Subclasses that add instance attributes
+        must declare their own `__slots__` (or `__slots__ = ()` if they add none) to keep
+        that saving.
+    """
+
+    __slots__ = ("_qubit_count", "_ascii_symbols")
+
+    # Class attribute, refreshed per subclass by __init_subclass__; not in __slots__
+    _name = "QuantumOperator"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolve the class name once per class instead of walking
+        # self -> __class__ -> __name__ on every `name` access
+        cls._name = cls.__name__
 
     def __init__(self, qubit_count: int, ascii_symbols: Sequence[str]):
         """
@@ -49,7 +68,11 @@ class QuantumOperator(Operator):
         if len(ascii_symbols) != qubit_count:
             msg = f"ascii_symbols, {ascii_symbols}, length must equal qubit_count, {qubit_count}"
             raise ValueError(msg)
-        self._ascii_symbols = tuple(ascii_symbols)
+        # Most callers pass a tuple already, in which case it can be shared as-is;
+        # one tuple allocation per operator adds up on long circuits
+        self._ascii_symbols = (
+            ascii_symbols if isinstance(ascii_symbols, tuple) else tuple(ascii_symbols)
+        )
 
     @property
     def qubit_count(self) -> int:
@@ -57,8 +80,8 @@ class QuantumOperator(Operator):
         return self._qubit_count
 
     @property
-    def ascii_symbols(self) -> List[str]:
-        """List[str]: Returns the ascii symbols for the quantum operator."""
+    def ascii_symbols(self) -> Tuple[str, ...]:
+        """Tuple[str, ...]: Returns the ascii symbols for the quantum operator."""
         return self._ascii_symbols
 
     @property
@@ -69,7 +92,7 @@ class QuantumOperator(Operator):
         Returns:
             The name of the quantum operator as a string
         """
-        return self.__class__.__name__
+        return self._name
 
     def to_ir(self, *args, **kwargs) -> Any:
         """Returns IR representation of quantum operator
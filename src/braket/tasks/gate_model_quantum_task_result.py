@@ -31,6 +31,33 @@ from braket.task_result import (
 T = TypeVar("T")
 
 
+def _cast_probability(value) -> np.ndarray:
+    return np.array(value)
+
+
+def _cast_statevector(value) -> np.ndarray:
+    # One C-level pass over the (real, imag) pairs instead of a Python
+    # loop constructing a complex per entry
+    return np.asarray(value, dtype=np.float64).view(np.complex128).reshape(-1)
+
+
+def _cast_amplitude(value) -> Dict[str, complex]:
+    amplitudes = np.fromiter(
+        (component for pair in value.values() for component in pair),
+        dtype=np.float64,
+        count=2 * len(value),
+    ).view(np.complex128)
+    return dict(zip(value, amplitudes))
+
+
+# Result types not present here (e.g. expectation, variance, sample) need no casting
+_RESULT_TYPE_CASTS = {
+    "probability": _cast_probability,
+    "statevector": _cast_statevector,
+    "amplitude": _cast_amplitude,
+}
+
+
 @dataclass
 class GateModelQuantumTaskResult:
     """
@@ -303,16 +330,13 @@ class GateModelQuantumTaskResult:
             gate_model_task_result (GateModelTaskResult): GateModelTaskResult representing the
                 results.
         """
-        if gate_model_task_result.resultTypes:
-            for result_type in gate_model_task_result.resultTypes:
-                type = result_type.type.type
-                if type == "probability":
-                    result_type.value = np.array(result_type.value)
-                elif type == "statevector":
-                    result_type.value = np.array([complex(*value) for value in result_type.value])
-                elif type == "amplitude":
-                    for state in result_type.value:
-                        result_type.value[state] = complex(*result_type.value[state])
+        result_types = gate_model_task_result.resultTypes
+        if not result_types:
+            return
+        for result_type in result_types:
+            cast = _RESULT_TYPE_CASTS.get(result_type.type.type)
+            if cast is not None:
+                result_type.value = cast(result_type.value)
 
     @staticmethod
     def _calculate_result_types(
@@ -12,6 +12,7 @@
 # language governing permissions and limitations under the License.
 
 import asyncio
+import json
 import threading
 import time
 from unittest.mock import MagicMock, Mock, patch
@@ -20,7 +21,7 @@ import pytest
 from common_test_utils import MockS3
 
 from braket.annealing.problem import Problem, ProblemType
-from braket.aws import AwsQuantumTask
+from braket.aws import AwsQuantumTask, aws_quantum_task
 from braket.aws.aws_session import AwsSession
 from braket.circuits import Circuit
 from braket.device_schema import GateModelParameters
@@ -112,6 +113,25 @@ def test_metadata(quantum_task):
     assert quantum_task.metadata(use_cached_value=True) == metadata_1
 
 
+def test_metadata_cached_while_terminal_and_fresh(quantum_task):
+    _mock_metadata(quantum_task._aws_session, "COMPLETED")
+    _mock_s3(quantum_task._aws_session, MockS3.MOCK_S3_RESULT_GATE_MODEL)
+    quantum_task.result()
+
+    call_count = quantum_task._aws_session.get_quantum_task.call_count
+    assert quantum_task.metadata() == _metadata_return_value("COMPLETED")
+    # Terminal metadata was just fetched by result(); no extra GetQuantumTask call
+    assert quantum_task._aws_session.get_quantum_task.call_count == call_count
+
+
+def test_metadata_not_cached_while_not_terminal(quantum_task):
+    metadata = {"status": "RUNNING"}
+    quantum_task._aws_session.get_quantum_task.return_value = metadata
+    assert quantum_task.metadata() == metadata
+    assert quantum_task.metadata() == metadata
+    assert quantum_task._aws_session.get_quantum_task.call_count == 2
+
+
 def test_state(quantum_task):
     state_1 = "RUNNING"
     _mock_metadata(quantum_task._aws_session, state_1)
@@ -155,9 +175,11 @@ def test_initialize_asyncio_event_loop_if_required(mock_asyncio, quantum_task):
     mock_asyncio.set_event_loop.return_value = MagicMock()
     mock_asyncio.new_event_loop.return_value = MagicMock()
 
+    quantum_task._get_future()
     quantum_task._get_future()
 
-    assert mock_asyncio.get_event_loop.call_count == 2
+    # The loop is looked up once, then cached on the instance
+    assert mock_asyncio.get_event_loop.call_count == 1
     assert mock_asyncio.set_event_loop.call_count == 1
     assert mock_asyncio.new_event_loop.call_count == 1
 
@@ -171,7 +193,7 @@ def test_result_circuit(circuit_task):
 
     s3_bucket = circuit_task.metadata()["outputS3Bucket"]
     s3_object_key = circuit_task.metadata()["outputS3Directory"]
-    circuit_task._aws_session.retrieve_s3_object_body.assert_called_with(
+    circuit_task._aws_session.retrieve_s3_object_stream.assert_called_with(
         s3_bucket, f"{s3_object_key}/results.json"
     )
 
@@ -185,7 +207,7 @@ def test_result_annealing(annealing_task):
 
     s3_bucket = annealing_task.metadata()["outputS3Bucket"]
     s3_object_key = annealing_task.metadata()["outputS3Directory"]
-    annealing_task._aws_session.retrieve_s3_object_body.assert_called_with(
+    annealing_task._aws_session.retrieve_s3_object_stream.assert_called_with(
         s3_bucket, f"{s3_object_key}/results.json"
     )
 
@@ -235,6 +257,102 @@ def test_async_result(circuit_task):
     assert result_from_future == expected
 
 
+def test_result_notification_queue(aws_session):
+    _mock_metadata(aws_session, "RUNNING")
+    _mock_s3(aws_session, MockS3.MOCK_S3_RESULT_GATE_MODEL)
+    aws_session.receive_s3_notifications.return_value = [f"{S3_TARGET.key}/results.json"]
+
+    quantum_task = AwsQuantumTask(
+        "foo:bar:arn",
+        aws_session,
+        poll_timeout_seconds=2,
+        notification_queue_url="https://queue-url",
+    )
+    expected = GateModelQuantumTaskResult.from_string(MockS3.MOCK_S3_RESULT_GATE_MODEL)
+    assert quantum_task.result() == expected
+    aws_session.receive_s3_notifications.assert_called_with(
+        "https://queue-url", [f"{S3_TARGET.key}/results.json"]
+    )
+
+
+def test_result_notification_queue_task_already_completed(aws_session):
+    _mock_metadata(aws_session, "COMPLETED")
+    _mock_s3(aws_session, MockS3.MOCK_S3_RESULT_GATE_MODEL)
+
+    quantum_task = AwsQuantumTask(
+        "foo:bar:arn",
+        aws_session,
+        poll_timeout_seconds=2,
+        notification_queue_url="https://queue-url",
+    )
+    expected = GateModelQuantumTaskResult.from_string(MockS3.MOCK_S3_RESULT_GATE_MODEL)
+    assert quantum_task.result() == expected
+    aws_session.receive_s3_notifications.assert_not_called()
+
+
+def test_result_notification_queue_timeout(aws_session):
+    _mock_metadata(aws_session, "RUNNING")
+    aws_session.receive_s3_notifications.return_value = []
+
+    quantum_task = AwsQuantumTask(
+        "foo:bar:arn",
+        aws_session,
+        poll_timeout_seconds=0.5,
+        notification_queue_url="https://queue-url",
+    )
+    assert quantum_task.result() is None
+
+
+def test_failed_task_notification_queue(aws_session):
+    _mock_metadata(aws_session, "FAILED")
+
+    quantum_task = AwsQuantumTask(
+        "foo:bar:arn",
+        aws_session,
+        poll_timeout_seconds=2,
+        notification_queue_url="https://queue-url",
+    )
+    assert quantum_task.result() is None
+    aws_session.receive_s3_notifications.assert_not_called()
+
+
+def test_results(aws_session):
+    _mock_metadata(aws_session, "COMPLETED")
+    _mock_s3(aws_session, MockS3.MOCK_S3_RESULT_GATE_MODEL)
+
+    tasks = [
+        AwsQuantumTask(f"foo:bar:arn-{i}", aws_session, poll_timeout_seconds=2) for i in range(3)
+    ]
+    expected = GateModelQuantumTaskResult.from_string(MockS3.MOCK_S3_RESULT_GATE_MODEL)
+    assert AwsQuantumTask.results(tasks) == [expected] * 3
+
+
+def test_results_with_failed_task(aws_session):
+    _mock_metadata(aws_session, "COMPLETED")
+    _mock_s3(aws_session, MockS3.MOCK_S3_RESULT_GATE_MODEL)
+    failed_session = Mock()
+    _mock_metadata(failed_session, "FAILED")
+
+    tasks = [
+        AwsQuantumTask("foo:bar:arn-0", aws_session, poll_timeout_seconds=2),
+        AwsQuantumTask("foo:bar:arn-1", failed_session, poll_timeout_seconds=2),
+    ]
+    expected = GateModelQuantumTaskResult.from_string(MockS3.MOCK_S3_RESULT_GATE_MODEL)
+    assert AwsQuantumTask.results(tasks) == [expected, None]
+
+
+def test_result_fast_path_for_terminal_task(circuit_task):
+    _mock_metadata(circuit_task._aws_session, "COMPLETED")
+    _mock_s3(circuit_task._aws_session, MockS3.MOCK_S3_RESULT_GATE_MODEL)
+
+    expected = GateModelQuantumTaskResult.from_string(MockS3.MOCK_S3_RESULT_GATE_MODEL)
+    assert circuit_task.result() == expected
+    # An already-completed task is resolved with one synchronous GetQuantumTask
+    # call; the event-loop polling machinery is never started
+    assert circuit_task._loop is None
+    assert circuit_task._aws_session.get_quantum_task.call_count == 1
+
+
 def test_failed_task(quantum_task):
     _mock_metadata(quantum_task._aws_session, "FAILED")
     _mock_s3(quantum_task._aws_session, MockS3.MOCK_S3_RESULT_GATE_MODEL)
@@ -258,6 +376,36 @@ def test_timeout_completed(aws_session):
     )
 
 
+def test_poll_interval_backoff(aws_session):
+    _mock_s3(aws_session, MockS3.MOCK_S3_RESULT_GATE_MODEL)
+    # The first RUNNING is consumed by result()'s up-front terminal-state check
+    aws_session.get_quantum_task.side_effect = [
+        _metadata_return_value(state)
+        for state in ["RUNNING", "RUNNING", "RUNNING", "RUNNING", "COMPLETED"]
+    ]
+
+    sleep_durations = []
+    original_sleep = asyncio.sleep
+
+    async def record_sleep(duration):
+        sleep_durations.append(duration)
+        await original_sleep(0)
+
+    quantum_task = AwsQuantumTask(
+        "foo:bar:arn", aws_session, poll_timeout_seconds=120, poll_interval_seconds=1
+    )
+    with patch("asyncio.sleep", record_sleep):
+        assert quantum_task.result() == GateModelQuantumTaskResult.from_string(
+            MockS3.MOCK_S3_RESULT_GATE_MODEL
+        )
+
+    # Interval backs off while the status does not change, with jitter applied
+    assert len(sleep_durations) == 3
+    assert 0.9 * 1 <= sleep_durations[0] <= 1
+    assert sleep_durations[0] < sleep_durations[1] < sleep_durations[2]
+    assert all(duration <= AwsQuantumTask.RESULTS_POLL_INTERVAL_MAX for duration in sleep_durations)
+
+
 def test_timeout_no_result_terminal_state(aws_session):
     _mock_metadata(aws_session, "RUNNING")
     _mock_s3(aws_session, MockS3.MOCK_S3_RESULT_GATE_MODEL)
@@ -314,6 +462,18 @@ def test_from_circuit_with_shots(device_arn, device_parameters_class, aws_sessio
     )
 
 
+def test_from_circuit_device_parameters_cached(aws_session, circuit):
+    aws_quantum_task._device_parameters_json.cache_clear()
+    aws_session.create_quantum_task.return_value = "task-arn-1"
+
+    AwsQuantumTask.create(aws_session, "device/qpu/ionq", circuit, S3_TARGET, 10)
+    AwsQuantumTask.create(aws_session, "device/qpu/ionq", circuit, S3_TARGET, 10)
+
+    cache_info = aws_quantum_task._device_parameters_json.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
+
 @pytest.mark.xfail(raises=ValueError)
 def test_from_circuit_with_shots_value_error(aws_session, arn, circuit):
     mocked_task_arn = "task-arn-1"
@@ -359,6 +519,7 @@ def test_init_new_thread(aws_session, arn):
 
 @patch("braket.aws.aws_quantum_task.boto3.Session")
 def test_aws_session_for_task_arn(mock_session):
+    aws_quantum_task._aws_session_for_region.cache_clear()
     region = "us-west-2"
     arn = f"arn:aws:aqx:{region}:account_id:quantum-task:task_id"
     mock_boto_session = Mock()
@@ -369,6 +530,23 @@ def test_aws_session_for_task_arn(mock_session):
     assert aws_session.boto_session == mock_boto_session
 
 
+@patch("braket.aws.aws_quantum_task.boto3.Session")
+def test_aws_session_for_task_arn_shared_within_region(mock_session):
+    aws_quantum_task._aws_session_for_region.cache_clear()
+    mock_session.return_value = Mock()
+    arn_1 = "arn:aws:aqx:us-west-2:account_id:quantum-task:task_1"
+    arn_2 = "arn:aws:aqx:us-west-2:account_id:quantum-task:task_2"
+    arn_other_region = "arn:aws:aqx:us-east-1:account_id:quantum-task:task_3"
+
+    session_1 = AwsQuantumTask._aws_session_for_task_arn(arn_1)
+    session_2 = AwsQuantumTask._aws_session_for_task_arn(arn_2)
+    session_3 = AwsQuantumTask._aws_session_for_task_arn(arn_other_region)
+
+    assert session_1 is session_2
+    assert session_1 is not session_3
+    assert mock_session.call_count == 2
+
+
 def _init_and_add_to_list(aws_session, arn, task_list):
     task_list.append(AwsQuantumTask(arn, aws_session, GateModelQuantumTaskResult.from_string))
 
@@ -376,26 +554,32 @@ def _init_and_add_to_list(aws_session, arn, task_list):
 def _assert_create_quantum_task_called_with(
     aws_session, arn, task_description, s3_results_prefix, shots, device_parameters
 ):
-    aws_session.create_quantum_task.assert_called_with(
-        **{
-            "deviceArn": arn,
-            "outputS3Bucket": s3_results_prefix[0],
-            "outputS3KeyPrefix": s3_results_prefix[1],
-            "action": task_description.to_ir().json(),
-            "deviceParameters": device_parameters.json(),
-            "shots": shots,
-        }
-    )
+    call_kwargs = aws_session.create_quantum_task.call_args[1]
+    # The action encoder (orjson vs stdlib) affects whitespace only, so the
+    # action is compared as parsed JSON rather than as a string
+    assert json.loads(call_kwargs.pop("action")) == json.loads(task_description.to_ir().json())
+    assert call_kwargs == {
+        "deviceArn": arn,
+        "outputS3Bucket": s3_results_prefix[0],
+        "outputS3KeyPrefix": s3_results_prefix[1],
+        "deviceParameters": device_parameters.json(),
+        "shots": shots,
+    }
 
 
-def _mock_metadata(aws_session, state):
-    return_value = {
+def _metadata_return_value(state):
+    return {
         "status": state,
         "outputS3Bucket": S3_TARGET.bucket,
         "outputS3Directory": S3_TARGET.key,
     }
-    aws_session.get_quantum_task.return_value = return_value
+
+
+def _mock_metadata(aws_session, state):
+    aws_session.get_quantum_task.return_value = _metadata_return_value(state)
 
 
 def _mock_s3(aws_session, result):
-    aws_session.retrieve_s3_object_body.return_value = result
+    mock_stream = Mock()
+    mock_stream.read.return_value = result.encode("utf-8")
+    aws_session.retrieve_s3_object_stream.return_value = mock_stream
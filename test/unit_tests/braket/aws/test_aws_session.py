@@ -72,6 +72,22 @@ def test_retrieve_s3_object_body_success(boto_session):
     assert return_value == json.dumps(TEST_S3_OBJ_CONTENTS)
 
 
+def test_retrieve_s3_object_stream(boto_session):
+    bucket_name = "braket-integ-test"
+    filename = "tasks/test_task_1.json"
+
+    mock_resource = Mock()
+    boto_session.resource.return_value = mock_resource
+    mock_object = Mock()
+    mock_resource.Object.return_value = mock_object
+    mock_body_object = Mock()
+    mock_object.get.return_value = {"Body": mock_body_object}
+
+    aws_session = AwsSession(boto_session=boto_session)
+    assert aws_session.retrieve_s3_object_stream(bucket_name, filename) == mock_body_object
+    mock_resource.Object.assert_called_with(bucket_name, filename)
+
+
 @pytest.mark.xfail(raises=ClientError)
 def test_retrieve_s3_object_body_client_error(boto_session):
     bucket_name = "braket-integ-test"
@@ -88,6 +104,68 @@ def test_retrieve_s3_object_body_client_error(boto_session):
     aws_session.retrieve_s3_object_body(bucket_name, filename)
 
 
+def _s3_notification(object_key):
+    record = {"eventName": "ObjectCreated:Put", "s3": {"object": {"key": object_key}}}
+    return json.dumps({"Records": [record]})
+
+
+def test_receive_s3_notifications(aws_session):
+    queue_url = "https://queue-url"
+    mock_sqs = Mock()
+    aws_session.boto_session.client.return_value = mock_sqs
+    mock_sqs.receive_message.return_value = {
+        "Messages": [
+            {
+                "MessageId": "1",
+                "ReceiptHandle": "receipt-1",
+                "Body": _s3_notification("bar/results.json"),
+            },
+            {
+                "MessageId": "2",
+                "ReceiptHandle": "receipt-2",
+                "Body": json.dumps({"Message": _s3_notification("bar/results.json")}),
+            },
+            {
+                "MessageId": "3",
+                "ReceiptHandle": "receipt-3",
+                "Body": json.dumps({"Event": "s3:TestEvent"}),
+            },
+            {
+                "MessageId": "4",
+                "ReceiptHandle": "receipt-4",
+                "Body": _s3_notification("other-task/results.json"),
+            },
+        ]
+    }
+
+    object_keys = aws_session.receive_s3_notifications(queue_url, ["bar/results.json"])
+
+    assert object_keys == ["bar/results.json", "bar/results.json"]
+    aws_session.boto_session.client.assert_called_with("sqs")
+    mock_sqs.receive_message.assert_called_with(
+        QueueUrl=queue_url, MaxNumberOfMessages=10, WaitTimeSeconds=20
+    )
+    # The matched messages and the record-less test event are deleted; the
+    # notification for the other object stays on the queue for its own consumer
+    mock_sqs.delete_message_batch.assert_called_with(
+        QueueUrl=queue_url,
+        Entries=[
+            {"Id": "1", "ReceiptHandle": "receipt-1"},
+            {"Id": "2", "ReceiptHandle": "receipt-2"},
+            {"Id": "3", "ReceiptHandle": "receipt-3"},
+        ],
+    )
+
+
+def test_receive_s3_notifications_no_messages(aws_session):
+    mock_sqs = Mock()
+    aws_session.boto_session.client.return_value = mock_sqs
+    mock_sqs.receive_message.return_value = {}
+
+    assert aws_session.receive_s3_notifications("https://queue-url", ["bar/results.json"]) == []
+    mock_sqs.delete_message_batch.assert_not_called()
+
+
 def test_get_device(boto_session):
     braket_client = Mock()
     return_val = {"deviceArn": "arn1", "deviceName": "name1"}
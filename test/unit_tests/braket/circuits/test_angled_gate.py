@@ -11,6 +11,7 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import numpy as np
 import pytest
 
 from braket.circuits import AngledGate, Gate
@@ -41,6 +42,13 @@ def test_getters():
     assert gate.angle == angle
 
 
+@pytest.mark.parametrize("angle", [1, np.float64(0.15), np.int64(2)])
+def test_angle_cast_to_float(angle):
+    gate = AngledGate(angle=angle, qubit_count=1, ascii_symbols=["foo"])
+    assert type(gate.angle) is float
+    assert gate.angle == float(angle)
+
+
 @pytest.mark.xfail(raises=AttributeError)
 def test_angle_setter(angled_gate):
     angled_gate.angle = 0.14
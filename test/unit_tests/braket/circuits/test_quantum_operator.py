@@ -46,6 +46,14 @@ def test_name(quantum_operator):
     assert quantum_operator.name == expected
 
 
+def test_name_of_subclass():
+    class FooQuantumOperator(QuantumOperator):
+        pass
+
+    operator = FooQuantumOperator(qubit_count=1, ascii_symbols=["foo"])
+    assert operator.name == "FooQuantumOperator"
+
+
 def test_getters():
     qubit_count = 2
     ascii_symbols = ("foo", "bar")
@@ -55,6 +63,17 @@ def test_getters():
     assert quantum_operator.ascii_symbols == ascii_symbols
 
 
+def test_ascii_symbols_tuple_shared():
+    ascii_symbols = ("foo", "bar")
+    quantum_operator = QuantumOperator(qubit_count=2, ascii_symbols=ascii_symbols)
+    assert quantum_operator.ascii_symbols is ascii_symbols
+
+
+def test_ascii_symbols_list_copied_to_tuple():
+    quantum_operator = QuantumOperator(qubit_count=2, ascii_symbols=["foo", "bar"])
+    assert quantum_operator.ascii_symbols == ("foo", "bar")
+
+
 @pytest.mark.xfail(raises=AttributeError)
 def test_qubit_count_setter(quantum_operator):
     quantum_operator.qubit_count = 10